@@ -20,10 +20,12 @@ from __future__ import annotations
 
 import argparse
 import re
+import string
 import sys
 from pathlib import Path
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
@@ -32,10 +34,10 @@ except ImportError:  # pragma: no cover - runtime dependency check
     raise SystemExit(1)
 
 try:
-    from thefuzz import fuzz
+    from rapidfuzz import fuzz, process
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
-        "Missing dependency: thefuzz. Install with: pip install thefuzz[speedup]",
+        "Missing dependency: rapidfuzz. Install with: pip install rapidfuzz",
         file=sys.stderr,
     )
     raise SystemExit(1)
@@ -107,7 +109,9 @@ FUZZY_PHRASES = [
     "agentic",
 ]
 
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# Byte translation table mapping everything except [a-z0-9] to a space.
+_ALNUM_BYTES = set((string.ascii_lowercase + string.digits).encode("ascii"))
+NON_ALNUM_TABLE = bytes(i if i in _ALNUM_BYTES else 0x20 for i in range(256))
 
 
 def normalize_text(text: str) -> str:
@@ -115,13 +119,17 @@ def normalize_text(text: str) -> str:
     lowered = text.lower()
     # Common catalog punctuation variant: "A.I." -> "ai" so word-boundary matches still work.
     lowered = re.sub(r"\ba\.\s*i\.?\b", "ai", lowered)
-    cleaned = NON_ALNUM_RE.sub(" ", lowered)
-    return " ".join(cleaned.split())
+    # Non-ASCII characters become "?" and, like all other non-[a-z0-9] bytes, are
+    # then translated to spaces in a single C-level table lookup pass.
+    cleaned = lowered.encode("ascii", "replace").translate(NON_ALNUM_TABLE)
+    return " ".join(cleaned.decode("ascii").split())
 
 
 def compile_patterns(patterns: list[str]) -> list[re.Pattern[str]]:
     """Compile regex patterns once for efficient reuse."""
-    return [re.compile(pattern) for pattern in patterns]
+    # Patterns only ever run on normalize_text output, which is pure [a-z0-9 ], so
+    # ASCII mode is equivalent and keeps sre off its slower Unicode \b checks.
+    return [re.compile(pattern, re.ASCII) for pattern in patterns]
 
 
 def matches_any(text_norm: str, patterns: list[re.Pattern[str]]) -> bool:
@@ -131,11 +139,25 @@ def matches_any(text_norm: str, patterns: list[re.Pattern[str]]) -> bool:
     return any(pattern.search(text_norm) for pattern in patterns)
 
 
-def max_fuzzy_score(text_norm: str, keyword_norms: list[str]) -> int:
-    """Return the max fuzzy match score against a list of normalized phrases."""
-    if not text_norm:
-        return 0
-    return max(fuzz.partial_ratio(text_norm, keyword) for keyword in keyword_norms)
+def max_fuzzy_scores(
+    texts_norm: list[str], keyword_norms: list[str], score_cutoff: int = 0
+) -> np.ndarray:
+    """Return each text's max fuzzy match score (0 below the cutoff) against the phrases."""
+    if not texts_norm:
+        return np.zeros(0)
+    # One multithreaded call scores every text against every phrase. Scores stay
+    # float64 and are rounded half to even with np.round, the same integer scale as
+    # Python's round(), so the cutoff only needs relaxing by half a point to let
+    # rapidfuzz skip hopeless pairs without dropping scores that round up to it.
+    scores = process.cdist(
+        texts_norm,
+        keyword_norms,
+        scorer=fuzz.partial_ratio,
+        score_cutoff=max(score_cutoff - 0.5, 0),
+        dtype=np.float64,
+        workers=-1,
+    )
+    return np.round(scores.max(axis=1))
 
 
 def main() -> None:
@@ -214,8 +236,12 @@ def main() -> None:
     fuzzy_phrases = [normalize_text(keyword) for keyword in FUZZY_PHRASES]
     title_series = df[args.title_col].fillna("").astype(str)
     description_series = df[args.description_col].fillna("").astype(str)
-    text_series = title_series + " " + description_series
-    text_norm_series = text_series.map(normalize_text)
+    # Courses recur across terms with identical text, so normalize and match each
+    # distinct text once and broadcast the flags back to every row.
+    text_codes, unique_texts = pd.factorize(title_series + " " + description_series)
+    text_norm_series = pd.Series(
+        [normalize_text(text) for text in unique_texts], dtype=object
+    )
 
     # Primary match: explicit AI terms.
     primary_match = text_norm_series.map(
@@ -234,17 +260,16 @@ def main() -> None:
     if args.disable_fuzzy:
         fuzzy_match = False
     else:
-        fuzzy_scores = text_norm_series.map(
-            lambda text: max_fuzzy_score(text, fuzzy_phrases)
+        fuzzy_scores = max_fuzzy_scores(
+            text_norm_series.tolist(), fuzzy_phrases, score_cutoff=args.fuzzy_threshold
         )
         fuzzy_match = fuzzy_scores >= args.fuzzy_threshold
 
-    ethics_match = [
-        ethics_matcher.is_match(title, description)
-        for title, description in zip(title_series, description_series)
-    ]
+    ethics_match = ethics_matcher.match_series(title_series, description_series)
 
-    df["is_ai_related"] = keyword_match | fuzzy_match
+    df["is_ai_related"] = (keyword_match | fuzzy_match).to_numpy(dtype=bool)[
+        text_codes
+    ]
     df["is_ethics_related"] = ethics_match
 
     # Deduplicate by prefix + number and preserve a single AI + ethics flag per course.
@@ -9,10 +9,12 @@ from __future__ import annotations
 
 import argparse
 import re
+import string
 import sys
 from pathlib import Path
 
 try:
+    import numpy as np
     import pandas as pd
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
@@ -21,14 +23,27 @@ except ImportError:  # pragma: no cover - runtime dependency check
     raise SystemExit(1)
 
 try:
-    from thefuzz import fuzz  # type: ignore
+    import pyarrow as pa
+    import pyarrow.compute as pc
 except ImportError:  # pragma: no cover - runtime dependency check
     print(
-        "Missing dependency: thefuzz. Install with: pip install thefuzz[speedup]",
+        "Missing dependency: pyarrow. Install with: pip install pyarrow",
         file=sys.stderr,
     )
     raise SystemExit(1)
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - runtime dependency check
+    print(
+        "Missing dependency: rapidfuzz. Install with: pip install rapidfuzz",
+        file=sys.stderr,
+    )
+    raise SystemExit(1)
+
+# Local import after dependency checks so missing third-party libs fail with a clear message.
+from ethics_analysis import combine_patterns, load_courses
+
 # Broad patterns are grouped by label so the output can explain *why* a course matched.
 BROAD_PATTERNS: list[tuple[str, str]] = [
     ("artificial_intelligence", r"\bartificial intelligence\b"),
@@ -66,6 +81,22 @@ BROAD_PATTERNS: list[tuple[str, str]] = [
     ("data_science", r"\bdata science\b"),
 ]
 
+
+def group_patterns(patterns: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Merge patterns sharing a label into one alternation, ordered by label."""
+    grouped: dict[str, list[str]] = {}
+    for label, pattern in patterns:
+        grouped.setdefault(label, []).append(pattern)
+    return [
+        (label, combine_patterns(grouped[label]))
+        for label in sorted(grouped)
+    ]
+
+
+# One column per distinct label, already sorted, so a row's hits read off as its
+# reason string without deduplicating or sorting per row.
+BROAD_LABEL_PATTERNS = group_patterns(BROAD_PATTERNS)
+
 BROAD_FUZZY_PHRASES = [
     "artificial intelligence",
     "machine learning",
@@ -93,27 +124,64 @@ BROAD_FUZZY_PHRASES = [
     "data science",
 ]
 
-NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# See ai_analysis.NON_ALNUM_TABLE.
+_ALNUM_BYTES = set((string.ascii_lowercase + string.digits).encode("ascii"))
+NON_ALNUM_TABLE = bytes(i if i in _ALNUM_BYTES else 0x20 for i in range(256))
 
 
 def normalize_text(text: str) -> str:
     lowered = text.lower()
     # Common catalog punctuation variant: "A.I." -> "ai" so word-boundary matches still work.
     lowered = re.sub(r"\ba\.\s*i\.?\b", "ai", lowered)
-    cleaned = NON_ALNUM_RE.sub(" ", lowered)
-    return " ".join(cleaned.split())
-
-def best_fuzzy_match(text_norm: str, phrases: list[str]) -> tuple[int, str]:
-    if not text_norm:
-        return 0, ""
-    best_score = -1
-    best_phrase = ""
-    for phrase in phrases:
-        score = fuzz.partial_ratio(text_norm, phrase)
-        if score > best_score:
-            best_score = score
-            best_phrase = phrase
-    return best_score, best_phrase
+    # Same byte translation as ai_analysis.normalize_text.
+    cleaned = lowered.encode("ascii", "replace").translate(NON_ALNUM_TABLE)
+    return " ".join(cleaned.decode("ascii").split())
+
+def best_fuzzy_matches(
+    texts_norm: list[str], phrases: list[str], score_cutoff: int = 0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return each text's best score (0 below the cutoff) and the index of that phrase."""
+    if not texts_norm:
+        return np.zeros(0), np.zeros(0, dtype=np.intp)
+    # Scored and rounded as in ai_analysis.max_fuzzy_scores.
+    scores = process.cdist(
+        texts_norm,
+        phrases,
+        scorer=fuzz.partial_ratio,
+        score_cutoff=max(score_cutoff - 0.5, 0),
+        dtype=np.float64,
+        workers=-1,
+    )
+    # Ties are broken on the rounded scores, in phrase order, like the original
+    # integer-score loop: 78.95 and 78.57 both count as 79.
+    rounded = np.round(scores)
+    best = rounded.argmax(axis=1)
+    return rounded[np.arange(len(texts_norm)), best], best
+
+
+def match_pattern_matrix(texts: list[str], patterns: list[str]) -> np.ndarray:
+    """
+    Return an (n_texts, n_patterns) boolean matrix of regex hits.
+
+    Matching runs in Arrow's native RE2 kernels rather than a Python loop per row.
+    """
+    hits = np.zeros((len(texts), len(patterns)), dtype=bool)
+    # Normalized text is pure ASCII, so RE2 already scans it one byte per character;
+    # a binary array would not be faster.
+    arr = pa.array(texts, type=pa.string())
+    # Most rows match nothing, so one scan of the fused pattern rules them out. Each
+    # pattern is then scanned on the remaining rows only, since an alternation reports
+    # one branch per position and would drop overlapping labels (e.g. "ai" inside
+    # "generative ai").
+    candidates = pc.match_substring_regex(arr, combine_patterns(patterns))
+    candidate_rows = np.flatnonzero(candidates.to_numpy(zero_copy_only=False))
+    if len(candidate_rows) == 0:
+        return hits
+    candidate_arr = arr.take(pa.array(candidate_rows))
+    for j, pattern in enumerate(patterns):
+        mask = pc.match_substring_regex(candidate_arr, pattern)
+        hits[candidate_rows, j] = mask.to_numpy(zero_copy_only=False)
+    return hits
 
 
 def main() -> None:
@@ -151,43 +219,39 @@ def main() -> None:
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_csv(input_courses)
-    required_cols = ["prefix", "number", "title", "description"]
-    missing = [col for col in required_cols if col not in df.columns]
-    if missing:
-        print(f"Missing required columns: {missing}", file=sys.stderr)
-        raise SystemExit(1)
+    df = load_courses(input_courses, ["prefix", "number", "title", "description"])
 
-    compiled = [(label, re.compile(pattern)) for label, pattern in BROAD_PATTERNS]
+    labels = np.array([label for label, _ in BROAD_LABEL_PATTERNS], dtype=object)
     fuzzy_phrases = [normalize_text(term) for term in BROAD_FUZZY_PHRASES]
 
     titles = df["title"].fillna("").astype(str)
     descriptions = df["description"].fillna("").astype(str)
-    text_series = titles + " " + descriptions
-    text_norm_series = text_series.map(normalize_text)
+    # Courses recur across terms with identical text, so match each distinct text once
+    # and broadcast the results back to every row via the factorized codes.
+    text_codes, unique_texts = pd.factorize(titles + " " + descriptions)
+    unique_norms = [normalize_text(text) for text in unique_texts]
 
-    reasons: list[str] = []
-    matched: list[bool] = []
-    fuzzy_phrases_matched: list[str] = []
-
-    for text_norm in text_norm_series:
-        hits = [label for label, rx in compiled if rx.search(text_norm)]
-        reason = ",".join(sorted(set(hits))) if hits else ""
-        reasons.append(reason)
-        matched.append(bool(hits))
+    hit_matrix = match_pattern_matrix(
+        unique_norms, [pattern for _, pattern in BROAD_LABEL_PATTERNS]
+    )
+    matched = hit_matrix.any(axis=1)
+    reasons = [""] * len(unique_norms)
+    for i in np.flatnonzero(matched):
+        reasons[i] = ",".join(labels[hit_matrix[i]])
 
     if args.disable_fuzzy:
-        fuzzy_match = [False] * len(df)
-        fuzzy_phrases_matched = [""] * len(df)
+        fuzzy_match = np.zeros(len(unique_norms), dtype=bool)
+        fuzzy_phrases_matched = [""] * len(unique_norms)
     else:
-        fuzzy_match: list[bool] = []
-        for text in text_norm_series:
-            score, phrase = best_fuzzy_match(text, fuzzy_phrases)
-            is_match = score >= args.fuzzy_threshold
-            fuzzy_match.append(is_match)
-            fuzzy_phrases_matched.append(phrase if is_match else "")
+        scores, best = best_fuzzy_matches(
+            unique_norms, fuzzy_phrases, score_cutoff=args.fuzzy_threshold
+        )
+        fuzzy_match = scores >= args.fuzzy_threshold
+        fuzzy_phrases_matched = np.where(
+            fuzzy_match, np.asarray(fuzzy_phrases, dtype=object)[best], ""
+        ).tolist()
 
-    df["is_ai_candidate"] = [m or f for m, f in zip(matched, fuzzy_match)]
+    is_candidate = matched | fuzzy_match
 
     final_reasons: list[str] = []
     for reason, is_fuzzy, phrase in zip(reasons, fuzzy_match, fuzzy_phrases_matched):
@@ -198,8 +262,11 @@ def main() -> None:
         else:
             final_reasons.append("")
 
-    df["ai_candidate_reason"] = final_reasons
-    df["ai_candidate_fuzzy_phrase"] = fuzzy_phrases_matched
+    df["is_ai_candidate"] = is_candidate[text_codes]
+    df["ai_candidate_reason"] = np.asarray(final_reasons, dtype=object)[text_codes]
+    df["ai_candidate_fuzzy_phrase"] = np.asarray(
+        fuzzy_phrases_matched, dtype=object
+    )[text_codes]
 
     subset = (
         df[df["is_ai_candidate"]]
@@ -2,8 +2,8 @@
 Extracts course prefixes from the NAU Course Numbering and Prefixes PDF.
 
 This script uses the `pdfplumber` library to read a PDF file containing a table
-of course prefixes and their corresponding subjects. It then uses regular
-expressions to find and extract these prefixes.
+of course prefixes and their corresponding subjects. It reads the table cells
+directly and keeps every first-column cell that looks like a course prefix.
 
 The main purpose of this script is to generate the `PREFIXES` list used in the
 main `scrape.py` scraping script. When run as a standalone script, it prints
@@ -21,6 +21,9 @@ import pdfplumber
 PDF_PATH = "data/Course-Numbering-and-Prefixes.pdf"
 PREFIXES_PATH = "data/prefixes.json"
 
+# A prefix is defined as 2-6 uppercase letters, possibly with an ampersand.
+CODE_RE = re.compile(r"^[A-Z&]{2,6}$")
+
 
 def extract_prefixes(pdf_path: str) -> List[str]:
     """
@@ -34,30 +37,19 @@ def extract_prefixes(pdf_path: str) -> List[str]:
     """
     prefixes = set()
 
-    # Regex to match a line that starts with a course prefix (e.g., "ACC Accounting").
-    # A prefix is defined as 2-6 uppercase letters, possibly with an ampersand.
-    prefix_pattern = re.compile(r"^([A-Z&]{2,6})\s+([A-Za-z].+)$")
-
+    # The prefixes live in a two-column "Course Code | Course Subject" table. Reading
+    # table cells avoids matching prose lines, and header cells like "Course Code"
+    # never match CODE_RE, so no separate header/noise filtering is needed.
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
-            text = page.extract_text() or ""
-            for line in text.splitlines():
-                line = line.strip()
-                match = prefix_pattern.match(line)
-                if not match:
-                    continue
-
-                code = match.group(1)
-                subject = match.group(2).strip()
-
-                # Filter out common table headers or noise that might match the pattern.
-                if code in {"Course", "Code", "Subject", "Letter"}:
-                    continue
-                # Ensure the code is primarily alphabetic, allowing for '&'.
-                if not code.isalpha() and "&" not in code:
-                    continue
-
-                prefixes.add(code)
+            for table in page.extract_tables():
+                for row in table:
+                    if len(row) < 2:
+                        continue
+                    code = (row[0] or "").strip()
+                    subject = (row[1] or "").strip()
+                    if CODE_RE.match(code) and subject:
+                        prefixes.add(code)
 
     return sorted(list(prefixes))
 
@@ -1,21 +1,27 @@
 """
 This script scrapes course information from the NAU academic catalog.
 
-It uses Selenium to automate a web browser, iterating through a predefined list
-of course prefixes and academic terms. For each combination, it fetches a list
-of courses, scrapes detailed information from each course page, and stores the
-results in a CSV file.
+It iterates through a predefined list of course prefixes and academic terms.
+For each combination, it fetches a list of courses, scrapes detailed
+information from each course page, and stores the results in a CSV file.
 
-The script is designed to be resumable, loading existing data from the CSV
-and skipping courses that have already been scraped unless the `--overwrite`
-flag is provided.
+Catalog pages are server-rendered, so by default they are fetched with `httpx`
+and parsed with `selectolax`. Selenium is kept as a fallback for pages whose
+HTML does not contain the expected elements, and can be forced with
+`--backend selenium`.
+
+The script is designed to be resumable. Scraped courses are recorded in a
+SQLite database (`outputs/nau_courses.db`) as they arrive, and courses already
+in it are skipped unless the `--overwrite` flag is provided. The CSV is
+exported from the database once at the end of each run.
 
 Key functionalities:
 - Scrapes course details for specified academic terms.
 - Handles pagination and dynamic content loading.
-- Saves data to a CSV file (`outputs/nau_courses.csv`).
+- Saves data to a SQLite database and exports it to a CSV file (`outputs/nau_courses.csv`).
 - Logs course prefixes that yield no results (`outputs/nau_empty_prefixes.csv`).
-- Supports headless (default) and headed browser modes for scraping.
+- Scrapes prefixes in parallel on a pool of browsers behind a shared rate limit.
+- Supports headless (default) and headed browser modes for Selenium scraping.
 - Provides an option to overwrite existing data.
 """
 import argparse
@@ -23,16 +29,20 @@ import csv
 import json
 import os
 import re
+import sqlite3
+import sys
+import threading
 import time
-from dataclasses import asdict, dataclass, fields
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, fields, replace
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import List, Literal, Optional
+from urllib.parse import urljoin
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
     InvalidSessionIdException,
     JavascriptException,
@@ -42,6 +52,13 @@ from selenium.common.exceptions import (
     WebDriverException,
 )
 
+try:
+    import httpx
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency for the HTTP backend
+    httpx = None
+    LexborHTMLParser = None
+
 # =========================
 # CONFIG
 # =========================
@@ -56,14 +73,46 @@ TERM_CODES = {
 
 OUTPUT_DIR = "outputs"
 CSV_PATH = f"{OUTPUT_DIR}/nau_courses.csv"
+CSV_TMP_PATH = f"{CSV_PATH}.tmp"
+STATE_DB_PATH = f"{OUTPUT_DIR}/nau_courses.db"
 EMPTY_PREFIXES_CSV = f"{OUTPUT_DIR}/nau_empty_prefixes.csv"
 PREFIXES_PATH = "data/prefixes.json"
 
+# Seconds to wait for a page (HTTP timeout and Selenium explicit waits).
+PAGE_TIMEOUT = 15
+
+# CSS selector for course links on a results page.
+RESULT_LINK_SELECTOR = "dl#results-list dt.result-item > a"
+
 # Time to wait between requests to be polite to the server.
 SLEEP_TIME = 0.25
 
+# Number of prefixes scraped concurrently, each worker driving its own browser.
+DEFAULT_WORKERS = 4
+
+# Upper bound on page loads per second across all workers combined.
+MAX_REQUESTS_PER_SECOND = 4.0
+
+# Commit the state database after this many completed prefixes.
+CHECKPOINT_EVERY = 10
+
+# Write buffer for the course CSV export (1 MiB) so row writes are coalesced.
+WRITE_BUFFER_SIZE = 1 << 20
+
 VALID_PREFIX_RE = re.compile(r"^[A-Z&]{2,6}$")
 
+# Regex to parse a course header of the form "PREFIX 123 - Course Title".
+COURSE_HEADER_RE = re.compile(r"^([A-Z&]{2,6})\s+(\d{3}[A-Z]?)\s*-\s*(.+)$")
+
+# The term query parameter of a course URL; the rest identifies the course itself.
+TERM_PARAM_RE = re.compile(r"[?&]term=\d+")
+
+# HTTP errors that count as a failed page load (empty when httpx isn't installed).
+HTTP_ERRORS: tuple = (httpx.HTTPError,) if httpx is not None else ()
+
+# Errors from launching Chrome/ChromeDriver (e.g. neither is installed).
+DRIVER_START_ERRORS = (WebDriverException, OSError)
+
 # =========================
 # DATA MODEL
 # =========================
@@ -83,16 +132,133 @@ class Course:
     url: str
 
 
+@dataclass
+class PrefixResult:
+    """The outcome of scraping one (term, prefix) combination."""
+    term_label: str
+    term_code: int
+    prefix: str
+    status: Literal["ok", "empty", "timeout", "error"]
+    links_found: int
+    courses: List[Course] = field(default_factory=list)
+    reused: int = 0
+
+
+# Column order shared by the state database and the CSV export.
+COURSE_FIELDS = tuple(f.name for f in fields(Course))
+# Builds a row tuple in COURSE_FIELDS order without the deep copy `asdict` makes.
+course_row = attrgetter(*COURSE_FIELDS)
+EMPTY_PREFIX_FIELDS = ("term", "term_code", "prefix", "error")
+INSERT_IGNORE_SQL = (
+    f"INSERT OR IGNORE INTO courses ({', '.join(COURSE_FIELDS)}) "
+    f"VALUES ({', '.join('?' for _ in COURSE_FIELDS)})"
+)
+# Updates an existing URL in place rather than deleting it (as INSERT OR REPLACE
+# does), so the row keeps its rowid and therefore its position in the export.
+UPSERT_SQL = INSERT_IGNORE_SQL.replace("INSERT OR IGNORE", "INSERT", 1) + (
+    " ON CONFLICT(url) DO UPDATE SET "
+    + ", ".join(f"{name} = excluded.{name}" for name in COURSE_FIELDS if name != "url")
+)
+
+
 # =========================
 # UTILS
 # =========================
 
 
+class RateLimiter:
+    """
+    A thread-safe token bucket that caps the request rate across all workers.
+
+    Each call to `acquire` takes one token, blocking until one is available.
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self.rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait_s = (1 - self._tokens) / self.rate
+            time.sleep(wait_s)
+
+
+RATE_LIMITER = RateLimiter(MAX_REQUESTS_PER_SECOND)
+
+
+class DriverPool:
+    """
+    Hands each worker thread its own WebDriver, created lazily on first use.
+
+    Selenium drivers are not thread-safe, so a driver is never shared between
+    threads. All drivers are tracked so they can be shut down together.
+    """
+
+    def __init__(self, headless: bool):
+        self.headless = headless
+        self._local = threading.local()
+        self._drivers: List[WebDriver] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> WebDriver:
+        """Returns the calling thread's driver, creating it if needed."""
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            driver = make_driver(headless=self.headless)
+            self._local.driver = driver
+            with self._lock:
+                self._drivers.append(driver)
+        return driver
+
+    def restart(self) -> WebDriver:
+        """Replaces the calling thread's driver, e.g. after a lost session."""
+        driver = getattr(self._local, "driver", None)
+        if driver is not None:
+            with self._lock:
+                if driver in self._drivers:
+                    self._drivers.remove(driver)
+            try:
+                driver.quit()
+            except Exception:
+                pass  # Driver may already be gone
+            self._local.driver = None
+        return self.get()
+
+    def quit_all(self) -> None:
+        """Shuts down every driver created by the pool."""
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass  # Driver may already be gone
+
+
 def polite_sleep():
     """Waits for a short period to avoid overwhelming the server."""
     time.sleep(SLEEP_TIME)
 
 
+def polite_get(driver: WebDriver, url: str) -> None:
+    """Loads a page once the shared rate limiter allows another request."""
+    RATE_LIMITER.acquire()
+    driver.get(url)
+
+
 def ensure_output_dirs() -> None:
     """Ensure output directories exist for CSV outputs."""
     Path(CSV_PATH).parent.mkdir(parents=True, exist_ok=True)
@@ -113,7 +279,32 @@ def make_driver(headless: bool) -> WebDriver:
     if headless:
         opts.add_argument("--headless=new")
     opts.add_argument("--window-size=1400,900")
-    return webdriver.Chrome(options=opts)
+    driver = webdriver.Chrome(options=opts)
+    # Build the explicit wait once per driver instead of once per page.
+    driver._page_wait = make_page_wait(driver, PAGE_TIMEOUT)
+    return driver
+
+
+def make_page_wait(driver: WebDriver, timeout: float) -> WebDriverWait:
+    """Creates an explicit wait that keeps polling through transient script errors."""
+    return WebDriverWait(
+        driver,
+        timeout,
+        ignored_exceptions=(NoSuchElementException, JavascriptException),
+    )
+
+
+def page_wait(driver: WebDriver, timeout: float = PAGE_TIMEOUT) -> WebDriverWait:
+    """
+    Returns the driver's shared explicit wait for the given timeout.
+
+    Falls back to a fresh wait for drivers not created by `make_driver` or for a
+    non-default timeout.
+    """
+    wait = getattr(driver, "_page_wait", None)
+    if wait is None or timeout != PAGE_TIMEOUT:
+        return make_page_wait(driver, timeout)
+    return wait
 
 
 def results_url(prefix: str, term_code: int) -> str:
@@ -130,26 +321,116 @@ def results_url(prefix: str, term_code: int) -> str:
     return f"{BASE}/results?subject={prefix}&catNbr=&term={term_code}"
 
 
-def load_existing_urls() -> set[str]:
+def open_state_db(path: str = STATE_DB_PATH) -> sqlite3.Connection:
+    """
+    Opens (and creates if needed) the SQLite database holding scraped courses.
+
+    The `courses` table mirrors the `Course` dataclass with `url` as the primary
+    key. WAL journaling keeps committed rows safe if the scraper is killed.
+
+    Args:
+        path (str): Path to the SQLite database file.
+
+    Returns:
+        sqlite3.Connection: The open connection (caller closes).
+    """
+    ensure_output_dirs()
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS courses (
+            term TEXT,
+            catalog_year TEXT,
+            prefix TEXT,
+            number TEXT,
+            title TEXT,
+            description TEXT,
+            units TEXT,
+            sections_offered TEXT,
+            url TEXT PRIMARY KEY
+        )
+        """
+    )
+    conn.commit()
+    return conn
+
+
+def import_existing_csv(conn: sqlite3.Connection) -> int:
     """
-    Loads existing course URLs from the CSV file into a set.
+    Seeds an empty state database from an existing course CSV.
+
+    This lets runs resume from a CSV produced before the database existed (or
+    after the database file was deleted).
 
     Returns:
-        set[str]: A set of course URLs. Returns an empty set if the file
-                  does not exist.
+        int: The number of rows imported (0 if the database already had rows or
+             there is no CSV).
     """
-    existing = set()
+    if conn.execute("SELECT 1 FROM courses LIMIT 1").fetchone():
+        return 0
     try:
         with open(CSV_PATH, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                url = row.get("url")
-                if url:
-                    existing.add(url)
-        print(f"Loaded {len(existing)} existing courses from {CSV_PATH}")
+            rows = [
+                tuple(row.get(name) for name in COURSE_FIELDS)
+                for row in csv.DictReader(f)
+                if row.get("url")
+            ]
     except FileNotFoundError:
-        print(f"No existing CSV found at {CSV_PATH} — starting fresh.")
-    return existing
+        return 0
+    conn.executemany(INSERT_IGNORE_SQL, rows)
+    conn.commit()
+    return len(rows)
+
+
+def load_seen_urls(conn: sqlite3.Connection) -> set[str]:
+    """
+    Loads the URLs of every course already in the state database.
+
+    Returns:
+        set[str]: A set of course URLs.
+    """
+    return {url for (url,) in conn.execute("SELECT url FROM courses")}
+
+
+def course_key(url: str) -> str:
+    """Returns a course URL with its term parameter removed."""
+    return TERM_PARAM_RE.sub("", url)
+
+
+def save_courses(conn: sqlite3.Connection, courses: List[Course]) -> None:
+    """Inserts (or updates in place, by URL) scraped courses; the caller commits."""
+    conn.executemany(
+        UPSERT_SQL,
+        [course_row(course) for course in courses],
+    )
+
+
+def export_csv(conn: sqlite3.Connection) -> int:
+    """
+    Writes every course in the state database to the course CSV.
+
+    The export is written to a temp file and swapped in with `os.replace`, so the
+    CSV on disk is always complete.
+
+    Returns:
+        int: The number of rows written.
+    """
+    ensure_output_dirs()
+    count = 0
+    with open(
+        CSV_TMP_PATH, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(COURSE_FIELDS)
+        rows = conn.execute(
+            f"SELECT {', '.join(COURSE_FIELDS)} FROM courses ORDER BY rowid"
+        )
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    os.replace(CSV_TMP_PATH, CSV_PATH)
+    return count
 
 
 def load_existing_empty_prefix_keys() -> set[tuple[str, str, str]]:
@@ -230,46 +511,6 @@ def load_prefixes(path: str) -> List[str]:
     return unique
 
 
-def write_csv(rows: Dict[str, Dict]):
-    """
-    Writes the given course data to the main CSV file.
-
-    This function overwrites the entire file to ensure consistency.
-
-    Args:
-        rows (Dict[str, Dict]): A dictionary of course data, where keys are
-                                course URLs.
-    """
-    if not rows:
-        return
-
-    ensure_output_dirs()
-
-    # The fieldnames are derived from the Course dataclass for stability.
-    fieldnames = [field.name for field in fields(Course)]
-
-    with open(CSV_PATH, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows.values())
-
-
-def open_append_writer(fieldnames: List[str]) -> tuple[csv.DictWriter, object]:
-    """
-    Opens the CSV file in append mode and writes a header if needed.
-
-    Returns:
-        tuple[csv.DictWriter, object]: The writer and the file handle (caller closes).
-    """
-    ensure_output_dirs()
-    needs_header = not os.path.exists(CSV_PATH) or os.path.getsize(CSV_PATH) == 0
-    f = open(CSV_PATH, "a", newline="", encoding="utf-8")
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    if needs_header:
-        writer.writeheader()
-    return writer, f
-
-
 def log_empty_prefix(term_label: str, term_code: int, prefix: str, error: str):
     """
     Logs a course prefix that returned no results to a separate CSV file.
@@ -287,19 +528,10 @@ def log_empty_prefix(term_label: str, term_code: int, prefix: str, error: str):
         or os.path.getsize(EMPTY_PREFIXES_CSV) == 0
     )
     with open(EMPTY_PREFIXES_CSV, "a", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(
-            f, fieldnames=["term", "term_code", "prefix", "error"]
-        )
+        writer = csv.writer(f)
         if write_header:
-            writer.writeheader()
-        writer.writerow(
-            {
-                "term": term_label,
-                "term_code": term_code,
-                "prefix": prefix,
-                "error": error,
-            }
-        )
+            writer.writerow(EMPTY_PREFIX_FIELDS)
+        writer.writerow((term_label, term_code, prefix, error))
 
 
 # =========================
@@ -307,12 +539,29 @@ def log_empty_prefix(term_label: str, term_code: int, prefix: str, error: str):
 # =========================
 
 
+# Polls the results page state in one script call: "empty" for the "No courses
+# found" message, the list of course hrefs once links are present, else null.
+LIST_STATE_JS = """
+const main = document.querySelector('#main');
+if (main) {
+  for (const h1 of main.querySelectorAll('h1')) {
+    if ((h1.textContent || '').replace(/\\s+/g, ' ').trim() === 'No courses found') {
+      return 'empty';
+    }
+  }
+}
+const anchors = document.querySelectorAll(arguments[0]);
+if (!anchors.length) return null;
+return Array.from(anchors, (a) => a.getAttribute('href') ? a.href : null);
+"""
+
+
 def get_course_links(
     driver: WebDriver,
     prefix: str,
     term_code: int,
     retries: int = 2,
-    wait_s: int = 15,
+    wait_s: int = PAGE_TIMEOUT,
 ) -> tuple[list[str], Literal["ok", "empty", "timeout", "error"]]:
     """
     Fetches the list of individual course page URLs for a given prefix and term.
@@ -331,21 +580,14 @@ def get_course_links(
             - "timeout": results page did not load after retries
             - "error": unexpected Selenium/WebDriver error
     """
+    wait = page_wait(driver, wait_s)
     for attempt in range(retries + 1):
         try:
-            driver.get(results_url(prefix, term_code))
-            wait = WebDriverWait(driver, wait_s)
+            polite_get(driver, results_url(prefix, term_code))
 
             # Wait for either the course list or the "no courses found" message.
-            wait.until(
-                EC.any_of(
-                    EC.presence_of_element_located(
-                        (By.CSS_SELECTOR, "dl#results-list dt.result-item > a")
-                    ),
-                    EC.presence_of_element_located(
-                        (By.XPATH, "//div[@id='main']//h1[normalize-space()='No courses found']")
-                    ),
-                )
+            state = wait.until(
+                lambda d: d.execute_script(LIST_STATE_JS, RESULT_LINK_SELECTOR)
             )
         except TimeoutException:
             if attempt < retries:
@@ -358,148 +600,440 @@ def get_course_links(
             return [], "error"
 
         # If the "no courses found" message is present, return an empty list.
-        if driver.find_elements(By.XPATH, "//div[@id='main']//h1[normalize-space()='No courses found']"):
+        if state == "empty":
             polite_sleep()
             return [], "empty"
 
-        # Collect all unique course links from the page.
-        links = set()
-        for a in driver.find_elements(By.CSS_SELECTOR, "dl#results-list dt.result-item > a"):
-            href = a.get_attribute("href")
-            if href:
-                # Ensure the URL is absolute.
-                if href.startswith("course?"):
-                    href = f"{BASE}/{href}"
-                links.add(href)
+        # Collect all unique course links from the page. `a.href` is already
+        # resolved to an absolute URL by the browser.
+        links = {href for href in state if href}
 
         polite_sleep()
-        return sorted(list(links)), "ok"
+        return sorted(links), "ok"
 
     return [], "error"
 
 
-def text_after_label(driver: WebDriver, label: str) -> Optional[str]:
-    """
-    Extracts the text content immediately following a bolded label element.
+# Reads every course field in one script call instead of one WebDriver round-trip per
+# field, returning null until the header has rendered so it can double as the wait
+# condition. Labels are matched on whitespace-normalized text, like XPath
+# normalize-space().
+COURSE_FIELDS_JS = """
+const root = document.querySelector('#courseResults');
+const header = root && root.querySelector('h2');
+if (!header) return null;
+const clean = (text) => (text || '').replace(/\\s+/g, ' ').trim();
+const findLabel = (label) => {
+  for (const strong of root.querySelectorAll('strong')) {
+    if (clean(strong.textContent) === label) return strong;
+  }
+  return null;
+};
+const textAfter = (label) => {
+  const strong = findLabel(label);
+  if (!strong) return null;
+  let node = strong.nextSibling;
+  while (node) {
+    const text = (node.textContent || '').trim();
+    if (text) return text;
+    node = node.nextSibling;
+  }
+  return null;
+};
+const sections = [];
+const sectionsLabel = findLabel('Sections offered:');
+if (sectionsLabel) {
+  let el = sectionsLabel.nextElementSibling;
+  while (el) {
+    if (el.tagName === 'A') {
+      const text = el.innerText.trim();
+      if (text) sections.push(text);
+    }
+    el = el.nextElementSibling;
+  }
+}
+const yearHeader = document.querySelector('#h1-first');
+return {
+  header: header.innerText.trim(),
+  description: textAfter('Description:'),
+  units: textAfter('Units:'),
+  sections: sections,
+  catalog_year: yearHeader ? yearHeader.innerText : null,
+};
+"""
+
 
-    This is used to get fields like "Description:" or "Units:".
+def extract_course_fields(driver: WebDriver) -> Optional[dict]:
+    """
+    Extracts the raw course fields from the loaded course page in one call.
 
     Args:
         driver (WebDriver): The Selenium driver.
-        label (str): The text of the label to find (e.g., "Description").
 
     Returns:
-        Optional[str]: The text content, or None if the label isn't found.
+        Optional[dict]: Keys `header`, `description`, `units`, `sections` (list of
+                        section terms), and `catalog_year` (raw `#h1-first` text),
+                        with None for missing fields. None if the
+                        `#courseResults h2` header is not on the page (yet).
     """
-    try:
-        strong_element = driver.find_element(
-            By.XPATH,
-            f"//div[@id='courseResults']//strong[normalize-space()='{label}:']",
-        )
-    except NoSuchElementException:
-        return None
-
-    # Use JavaScript to get the next sibling text node's content.
-    # This is more robust for handling variations in spacing and nested elements.
-    try:
-        return driver.execute_script(
-            """
-            let node = arguments[0].nextSibling;
-            while (node) {
-              const text = (node.textContent || '').trim();
-              if (text) return text;
-              node = node.nextSibling;
-            }
-            return null;
-            """,
-            strong_element,
-        )
-    except (JavascriptException, WebDriverException):
-        return None
+    return driver.execute_script(COURSE_FIELDS_JS)
 
 
-def get_catalog_year(driver: WebDriver) -> Optional[str]:
+def parse_catalog_year(header_text: Optional[str]) -> Optional[str]:
     """
-    Extracts the catalog year from the course page header.
+    Parses the catalog year from the course page header text.
 
     Args:
-        driver (WebDriver): The Selenium driver.
+        header_text (Optional[str]): The `#h1-first` header text.
 
     Returns:
         Optional[str]: The catalog year (e.g., "2023-2024"), or None.
     """
-    try:
-        header_text = driver.find_element(By.CSS_SELECTOR, "#h1-first").text
-        match = re.search(r"Catalog Year\s*:\s*([0-9]{4}\s*-\s*[0-9]{4})", header_text)
-        if match:
-            return match.group(1).replace(" ", "")
-    except (NoSuchElementException, StaleElementReferenceException):
-        pass
+    if not header_text:
+        return None
+    match = re.search(r"Catalog Year\s*:\s*([0-9]{4}\s*-\s*[0-9]{4})", header_text)
+    if match:
+        return match.group(1).replace(" ", "")
     return None
 
 
-def get_sections_offered(driver: WebDriver) -> Optional[str]:
+def scrape_course(driver: WebDriver, url: str, term_label: str) -> Course:
     """
-    Extracts the "Sections offered" links from the course page.
+    Scrapes all relevant details from a single course page.
 
     Args:
         driver (WebDriver): The Selenium driver.
+        url (str): The URL of the course page to scrape.
+        term_label (str): The human-readable academic term for this scrape.
 
     Returns:
-        Optional[str]: A semicolon-separated string of section terms, or None.
+        Course: A `Course` dataclass instance with the scraped information.
     """
-    try:
-        anchors = driver.find_elements(
-            By.XPATH,
-            "//div[@id='courseResults']//strong[normalize-space()='Sections offered:']/following-sibling::a",
-        )
-        texts = [a.text.strip() for a in anchors if a.text.strip()]
-        return "; ".join(texts) if texts else None
-    except (StaleElementReferenceException, WebDriverException):
-        return None
+    polite_get(driver, url)
 
+    # Poll the field extraction itself: it returns None until the header renders,
+    # so waiting and reading every field take a single script call per poll.
+    page = page_wait(driver).until(extract_course_fields)
+    course = build_course(page, url, term_label)
 
-def scrape_course(driver: WebDriver, url: str, term_label: str) -> Course:
+    polite_sleep()
+    return course
+
+
+def build_course(page: dict, url: str, term_label: str) -> Course:
     """
-    Scrapes all relevant details from a single course page.
+    Builds a `Course` from the raw fields extracted from a course page.
 
     Args:
-        driver (WebDriver): The Selenium driver.
-        url (str): The URL of the course page to scrape.
+        page (dict): Fields as returned by `extract_course_fields` or
+                     `parse_course_html`.
+        url (str): The URL of the course page.
         term_label (str): The human-readable academic term for this scrape.
 
     Returns:
-        Course: A `Course` dataclass instance with the scraped information.
+        Course: The parsed course record.
     """
-    driver.get(url)
-    wait = WebDriverWait(driver, 15)
-
     # The main header contains the prefix, number, and title.
-    h2 = wait.until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, "#courseResults h2"))
-    )
-    header = h2.text.strip()
-
-    # Regex to parse "PREFIX 123 - Course Title"
-    match = re.match(r"^([A-Z&]{2,6})\s+(\d{3}[A-Z]?)\s*-\s*(.+)$", header)
+    header = page.get("header") or ""
+    match = COURSE_HEADER_RE.match(header)
     prefix, number, title = ("", "", header)
     if match:
         prefix, number, title = match.group(1), match.group(2), match.group(3).strip()
 
-    course = Course(
+    return Course(
         term=term_label,
-        catalog_year=get_catalog_year(driver),
+        catalog_year=parse_catalog_year(page.get("catalog_year")),
         prefix=prefix,
         number=number,
         title=title,
-        description=text_after_label(driver, "Description"),
-        units=text_after_label(driver, "Units"),
-        sections_offered=get_sections_offered(driver),
+        description=page.get("description"),
+        units=page.get("units"),
+        sections_offered="; ".join(page.get("sections") or []) or None,
         url=url,
     )
 
+
+# =========================
+# HTTP HELPERS
+# =========================
+
+
+def make_http_client(workers: int) -> "httpx.Client":
+    """
+    Creates a pooled HTTP client shared by all worker threads.
+
+    Args:
+        workers (int): The number of worker threads (sizes the connection pool).
+
+    Returns:
+        httpx.Client: The configured client.
+    """
+    return httpx.Client(
+        timeout=PAGE_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=max(1, workers)),
+    )
+
+
+def polite_fetch(client: "httpx.Client", url: str) -> str:
+    """Fetches a page's HTML once the shared rate limiter allows another request."""
+    RATE_LIMITER.acquire()
+    response = client.get(url)
+    response.raise_for_status()
+    return response.text
+
+
+def fetch_course_links(
+    client: "httpx.Client",
+    prefix: str,
+    term_code: int,
+    retries: int = 2,
+) -> Optional[tuple[list[str], Literal["ok", "empty", "timeout", "error"]]]:
+    """
+    Fetches course page URLs for a prefix and term from the server-rendered HTML.
+
+    Args:
+        client (httpx.Client): The HTTP client.
+        prefix (str): The course prefix.
+        term_code (int): The internal term code.
+        retries (int): The number of times to retry on timeout.
+
+    Returns:
+        Optional[tuple[list[str], str]]: (links, status) with the same statuses as
+            `get_course_links`, or None if the HTML contains neither course links
+            nor the "No courses found" message and the page should be rendered
+            with Selenium instead.
+    """
+    url = results_url(prefix, term_code)
+    for attempt in range(retries + 1):
+        try:
+            html = polite_fetch(client, url)
+        except httpx.TimeoutException:
+            if attempt < retries:
+                print(f"[WARN] Timeout on {prefix} list page, retrying...")
+                continue
+            print(f"[WARN] {prefix} list timed out after {retries} retries; skipping.")
+            return [], "timeout"
+        except httpx.HTTPError as e:
+            print(f"[WARN] Failed to load list page for {prefix}: {type(e).__name__}: {e}")
+            return [], "error"
+
+        tree = LexborHTMLParser(html)
+        for h1 in tree.css("#main h1"):
+            if " ".join(h1.text().split()) == "No courses found":
+                polite_sleep()
+                return [], "empty"
+
+        anchors = tree.css(RESULT_LINK_SELECTOR)
+        if not anchors:
+            return None
+
+        # Resolve relative hrefs against the results page, as a browser would.
+        links = {
+            urljoin(url, a.attributes["href"])
+            for a in anchors
+            if a.attributes.get("href")
+        }
+        polite_sleep()
+        return sorted(links), "ok"
+
+    return [], "error"
+
+
+def parse_course_html(html: str) -> Optional[dict]:
+    """
+    Extracts the raw course fields from a course page's HTML.
+
+    Mirrors `extract_course_fields`, but works on the server-rendered HTML.
+
+    Args:
+        html (str): The course page HTML.
+
+    Returns:
+        Optional[dict]: The same keys as `extract_course_fields`, or None if the
+                        page has no `#courseResults h2` header.
+    """
+    tree = LexborHTMLParser(html)
+    root = tree.css_first("#courseResults")
+    header = root.css_first("h2") if root is not None else None
+    if header is None:
+        return None
+
+    # Labels are matched on whitespace-normalized text; the first occurrence wins.
+    labels = {}
+    for strong in root.css("strong"):
+        labels.setdefault(" ".join(strong.text().split()), strong)
+
+    def text_after(label: str) -> Optional[str]:
+        strong = labels.get(label)
+        node = strong.next if strong is not None else None
+        while node is not None:
+            text = node.text(deep=True).strip()
+            if text:
+                return text
+            node = node.next
+        return None
+
+    sections: list[str] = []
+    node = labels["Sections offered:"].next if "Sections offered:" in labels else None
+    while node is not None:
+        if node.tag == "a":
+            text = node.text(deep=True).strip()
+            if text:
+                sections.append(text)
+        node = node.next
+
+    year_header = tree.css_first("#h1-first")
+    return {
+        "header": " ".join(header.text().split()),
+        "description": text_after("Description:"),
+        "units": text_after("Units:"),
+        "sections": sections,
+        "catalog_year": year_header.text() if year_header is not None else None,
+    }
+
+
+def fetch_course(
+    client: "httpx.Client", url: str, term_label: str
+) -> Optional[Course]:
+    """
+    Scrapes a course page from its server-rendered HTML.
+
+    Args:
+        client (httpx.Client): The HTTP client.
+        url (str): The URL of the course page to scrape.
+        term_label (str): The human-readable academic term for this scrape.
+
+    Returns:
+        Optional[Course]: The course, or None if the HTML lacks the course header
+                          and the page should be rendered with Selenium instead.
+    """
+    page = parse_course_html(polite_fetch(client, url))
+    if page is None:
+        return None
+
     polite_sleep()
-    return course
+    return build_course(page, url, term_label)
+
+
+def scrape_prefix(
+    pool: DriverPool,
+    client: Optional["httpx.Client"],
+    term_label: str,
+    term_code: int,
+    prefix: str,
+    claimed_urls: dict[str, int],
+    claim_lock: threading.Lock,
+    course_cache: Optional[dict[str, Course]] = None,
+    task_index: int = 0,
+) -> PrefixResult:
+    """
+    Scrapes every not-yet-seen course for a single prefix and term.
+
+    Runs on a worker thread. Pages are fetched over HTTP with `client` when one
+    is given, falling back to the thread's Selenium driver from `pool` for pages
+    whose HTML lacks the expected elements (or always, when `client` is None).
+    Each course URL is claimed in `claimed_urls` (guarded by `claim_lock`) before
+    it is scraped so concurrent workers rarely fetch the same page twice. A URL
+    listed under several prefixes belongs to the earliest task: an earlier task
+    takes over a claim made by a later one, so the course is recorded where a
+    sequential run would have put it.
+
+    Course pages rarely differ between terms, so when `course_cache` is given a
+    course already scraped for another term is copied with this term's label and
+    URL instead of being fetched again.
+
+    Args:
+        pool (DriverPool): Provides the worker's WebDriver, created on first use.
+        client (Optional[httpx.Client]): The shared HTTP client, or None.
+        term_label (str): The human-readable academic term.
+        term_code (int): The internal term code.
+        prefix (str): The course prefix.
+        claimed_urls (dict[str, int]): URLs already scraped or in progress,
+            mapped to the claiming task's index (-1 for earlier runs).
+        claim_lock (threading.Lock): Guards `claimed_urls` and `course_cache`.
+        course_cache (Optional[dict[str, Course]]): Scraped courses keyed by
+            `course_key`, or None to fetch every page.
+        task_index (int): This task's position in submission order.
+
+    Returns:
+        PrefixResult: The list-page status and the newly scraped courses.
+    """
+    listing = None
+    if client is not None:
+        listing = fetch_course_links(client, prefix, term_code)
+    if listing is None:
+        try:
+            listing = get_course_links(pool.get(), prefix, term_code)
+        except DRIVER_START_ERRORS as e:
+            print(f"[WARN] No WebDriver for {prefix} list page: {type(e).__name__}: {e}")
+            listing = [], "error"
+    links, status = listing
+
+    result = PrefixResult(term_label, term_code, prefix, status, len(links))
+    if status != "ok" or not links:
+        return result
+
+    # Set once Chrome fails to start, so later pages don't retry the launch.
+    driver_unavailable = False
+    for link in links:
+        # Skip if we've already seen this course (existing or claimed by another worker).
+        with claim_lock:
+            owner = claimed_urls.get(link)
+            if owner is not None and owner <= task_index:
+                continue
+            claimed_urls[link] = task_index
+            cached = (
+                course_cache.get(course_key(link)) if course_cache is not None else None
+            )
+        if cached is not None:
+            result.courses.append(replace(cached, term=term_label, url=link))
+            result.reused += 1
+            continue
+
+        try:
+            course = None
+            if client is not None:
+                course = fetch_course(client, link, term_label)
+            if course is None:
+                if driver_unavailable:
+                    print(f"[WARN] Skipping {link}: no WebDriver for the fallback.")
+                    continue
+                try:
+                    driver = pool.get()
+                except DRIVER_START_ERRORS as e:
+                    print(
+                        f"[WARN] No WebDriver for {link}; skipping the Selenium "
+                        f"fallback for the rest of {prefix}: {type(e).__name__}: {e}"
+                    )
+                    driver_unavailable = True
+                    continue
+                course = scrape_course(driver, link, term_label)
+            result.courses.append(course)
+            if course_cache is not None:
+                with claim_lock:
+                    course_cache.setdefault(course_key(link), course)
+        except InvalidSessionIdException:
+            print(
+                f"[WARN] WebDriver session lost while scraping {link}. "
+                "Restarting driver..."
+            )
+            try:
+                pool.restart()
+            except DRIVER_START_ERRORS as e:
+                print(f"[WARN] Could not restart WebDriver: {type(e).__name__}: {e}")
+                driver_unavailable = True
+            # The current link is skipped, but it will be picked up on a future run
+            # because it is never written to the CSV.
+        except HTTP_ERRORS + (
+            TimeoutException,
+            NoSuchElementException,
+            StaleElementReferenceException,
+            WebDriverException,
+        ) as e:
+            print(f"[WARN] Failed to scrape {link}: {type(e).__name__}: {e}")
+
+    return result
 
 
 # =========================
@@ -524,6 +1058,30 @@ def parse_args() -> argparse.Namespace:
         default=PREFIXES_PATH,
         help="Path to JSON file with course prefixes.",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["http", "selenium"],
+        default="http",
+        help=(
+            "How to load catalog pages: plain HTTP with a Selenium fallback "
+            "(default), or Selenium only."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"Number of prefixes to scrape in parallel (default: {DEFAULT_WORKERS}).",
+    )
+    parser.add_argument(
+        "--reuse-terms",
+        action="store_true",
+        help=(
+            "Copy a course page scraped for one term in this run to the other terms "
+            "instead of fetching it again. Only use when all TERM_CODES share a "
+            "catalog year; text that changed between terms is not picked up."
+        ),
+    )
     return parser.parse_args()
 
 
@@ -531,113 +1089,151 @@ def main():
     """
     The main execution function for the scraper.
 
-    Initializes the driver, loads existing data, iterates through terms and
-    prefixes, scrapes new courses, and saves the results.
+    Loads existing state, scrapes every (term, prefix) combination on a pool of
+    worker threads, records new courses in the state database from the main
+    thread as each prefix completes, and exports the CSV at the end.
     """
     args = parse_args()
     ensure_output_dirs()
     prefixes = load_prefixes(args.prefixes)
-    driver = make_driver(headless=not args.no_headless)
+    if args.backend == "http" and httpx is None:
+        print(
+            "Missing dependency for the HTTP backend: httpx, selectolax. Install with: "
+            "pip install httpx selectolax (or use --backend selenium)",
+            file=sys.stderr,
+        )
+        raise SystemExit(1)
+
+    # Drivers are only launched when a worker actually needs Selenium.
+    pool = DriverPool(headless=not args.no_headless)
+    client = make_http_client(args.workers) if args.backend == "http" else None
+    conn = open_state_db(STATE_DB_PATH)
 
-    fieldnames = [field.name for field in fields(Course)]
-    existing_urls: set[str] = set()
-    seen_urls: set[str] = set()
     logged_empty: set[tuple[str, str, str]] = set()
-    writer: csv.DictWriter | None = None
-    out_file = None
+    completed = False
 
     if args.overwrite:
-        print("Overwrite enabled: will stream-write a fresh CSV.")
-        # Start fresh for both output files.
-        Path(CSV_PATH).unlink(missing_ok=True)
+        print("Overwrite enabled: will re-scrape every course.")
+        # Start fresh for both outputs. The CSV itself is only replaced by the
+        # export once the run completes.
+        conn.execute("DELETE FROM courses")
+        conn.commit()
         Path(EMPTY_PREFIXES_CSV).unlink(missing_ok=True)
-
-        out_file = open(CSV_PATH, "w", newline="", encoding="utf-8")
-        writer = csv.DictWriter(out_file, fieldnames=fieldnames)
-        writer.writeheader()
     else:
-        existing_urls = load_existing_urls()
-        seen_urls = set(existing_urls)
+        imported = import_existing_csv(conn)
+        if imported:
+            print(f"Imported {imported} existing courses from {CSV_PATH}")
         logged_empty = load_existing_empty_prefix_keys()
-        writer, out_file = open_append_writer(fieldnames)
+
+    seen_urls = load_seen_urls(conn)
+    if seen_urls:
+        print(f"Loaded {len(seen_urls)} existing courses from {STATE_DB_PATH}")
+    else:
+        print(f"No existing courses in {STATE_DB_PATH} — starting fresh.")
+
+    # Workers claim URLs here before scraping; only the main thread touches the outputs.
+    claimed_urls = dict.fromkeys(seen_urls, -1)
+    claim_lock = threading.Lock()
+    # Filled only by this run, so a reused course always comes from a fresh fetch.
+    course_cache: Optional[dict[str, Course]] = {} if args.reuse_terms else None
+    executor = ThreadPoolExecutor(max_workers=max(1, args.workers))
 
     try:
-        total_prefixes = len(prefixes) * len(TERM_CODES)
-        step = 1
+        tasks = [
+            (term_label, term_code, prefix)
+            for term_label, term_code in TERM_CODES.items()
+            for prefix in prefixes
+        ]
+        total_prefixes = len(tasks)
         new_total = 0
-
-        for term_label, term_code in TERM_CODES.items():
-            for prefix in prefixes:
-                print(
-                    f"[{step}/{total_prefixes}] {term_label} {prefix}: fetching list..."
-                )
-                links, status = get_course_links(driver, prefix, term_code)
+        print(f"Scraping {total_prefixes} prefixes with {args.workers} workers...")
+
+        futures = {
+            executor.submit(
+                scrape_prefix,
+                pool,
+                client,
+                *task,
+                claimed_urls,
+                claim_lock,
+                course_cache,
+                index,
+            ): (index, *task)
+            for index, task in enumerate(tasks)
+        }
+
+        # Workers finish in any order, but results are recorded in submission order
+        # (term, then prefix) so the database rowids, and with them the exported
+        # CSV and the empty-prefix log, keep the same row order on every run.
+        finished: dict[int, PrefixResult] = {}
+        next_index = 0
+        for step, future in enumerate(as_completed(futures), start=1):
+            index, term_label, term_code, prefix = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # One failed prefix is logged like any other error, not fatal.
                 print(
-                    f"[{step}/{total_prefixes}] {term_label} {prefix}: {len(links)} courses found"
+                    f"[WARN] {term_label} {prefix} failed: {type(e).__name__}: {e}"
                 )
-
-                if status != "ok" or not links:
-                    error_value = status if status != "ok" else "empty"
-                    key = (str(term_code), prefix, error_value)
+                result = PrefixResult(term_label, term_code, prefix, "error", 0)
+            print(
+                f"[{step}/{total_prefixes}] {term_label} {prefix}: {result.links_found} courses found"
+            )
+            finished[index] = result
+
+            while next_index in finished:
+                result = finished.pop(next_index)
+                next_index += 1
+                term_label, prefix = result.term_label, result.prefix
+                if result.status != "ok" or not result.links_found:
+                    error_value = result.status if result.status != "ok" else "empty"
+                    key = (str(result.term_code), prefix, error_value)
                     if key not in logged_empty:
                         # Preserve the status so gaps can distinguish "empty" from transient failures.
-                        log_empty_prefix(term_label, term_code, prefix, error_value)
+                        log_empty_prefix(
+                            term_label, result.term_code, prefix, error_value
+                        )
                         logged_empty.add(key)
-                    step += 1
                     continue
-
-                new_count = 0
-                for link in links:
-                    # Skip if we've already seen this course (existing or earlier in run).
-                    if link in seen_urls:
-                        continue
-
-                    try:
-                        course = scrape_course(driver, link, term_label)
-                        row = asdict(course)
-                        if writer is None:
-                            raise RuntimeError("CSV writer not initialized")
-                        writer.writerow(row)
-                        seen_urls.add(link)
-                        new_count += 1
-                    except InvalidSessionIdException as e:
-                        print(
-                            f"[WARN] WebDriver session lost while scraping {link}. "
-                            "Restarting driver..."
-                        )
-                        try:
-                            driver.quit()
-                        except Exception:
-                            pass  # Driver may already be gone
-                        driver = make_driver(headless=not args.no_headless)
-                        # The current link is skipped, but it will be picked up on a future run
-                        # because it hasn't been added to `seen_urls`.
-                        continue
-                    except (
-                        TimeoutException,
-                        NoSuchElementException,
-                        StaleElementReferenceException,
-                        WebDriverException,
-                    ) as e:
-                        print(
-                            f"[WARN] Failed to scrape {link}: {type(e).__name__}: {e}"
-                        )
-
-                if new_count > 0:
-                    new_total += new_count
+                # An earlier task may have taken over (and recorded) a shared link.
+                courses = [c for c in result.courses if c.url not in seen_urls]
+                if courses:
+                    save_courses(conn, courses)
+                    seen_urls.update(course.url for course in courses)
+                    new_total += len(courses)
+                    reused = (
+                        f" ({result.reused} reused from another term)"
+                        if result.reused
+                        else ""
+                    )
                     print(
-                        f"[{step}/{total_prefixes}] {term_label} {prefix}: Scraped {new_count} new/updated courses"
+                        f"{term_label} {prefix}: Scraped {len(courses)} new/updated courses{reused}"
                     )
-                    if out_file:
-                        out_file.flush()
 
-                step += 1
+            if step % CHECKPOINT_EVERY == 0:
+                conn.commit()
+
+        completed = True
 
     finally:
         print("Scraping finished. Shutting down WebDriver.")
-        driver.quit()
-        if out_file:
-            out_file.close()
+        executor.shutdown(wait=True, cancel_futures=True)
+        pool.quit_all()
+        if client is not None:
+            client.close()
+        conn.commit()
+        # An interrupted --overwrite run keeps the previous CSV; its partial results
+        # stay in the database, so a normal run picks up where it stopped.
+        if completed or not args.overwrite:
+            exported = export_csv(conn)
+            print(f"Exported {exported} courses to {CSV_PATH}")
+        else:
+            print(
+                f"Run interrupted; {CSV_PATH} left unchanged. Re-run without "
+                "--overwrite to resume from the partial results."
+            )
+        conn.close()
 
     print(f"Finished. Total courses in CSV: {len(seen_urls)}")
 
@@ -15,7 +15,8 @@ sys.path.insert(0, str(REPO_ROOT))
 def _deps_available() -> bool:
     try:
         import pandas  # noqa: F401
-        import thefuzz  # noqa: F401
+        import pyarrow  # noqa: F401
+        import rapidfuzz  # noqa: F401
     except Exception:
         return False
     return True
@@ -33,7 +34,9 @@ def _write_csv(path: Path, rows: list[dict[str, str]]) -> None:
 
 
 @unittest.skipUnless(
-    HAS_DEPS, "Requires pandas + thefuzz. Install: pip install pandas thefuzz[speedup]"
+    HAS_DEPS,
+    "Requires pandas + pyarrow + rapidfuzz. "
+    "Install: pip install pandas pyarrow rapidfuzz",
 )
 class TestAiAnalysis(unittest.TestCase):
     def test_normalize_text_ai_punctuation(self) -> None:
@@ -43,6 +46,131 @@ class TestAiAnalysis(unittest.TestCase):
         self.assertEqual(ai_analysis.normalize_text("A.I."), "ai")
         self.assertEqual(ai_analysis_broad.normalize_text("A.I."), "ai")
 
+    def test_normalize_text_non_ascii_separates_words(self) -> None:
+        import ai_analysis
+        import ai_analysis_broad
+
+        # Non-ASCII punctuation and letters act as separators, like any other
+        # character outside [a-z0-9].
+        text = "Machine\u2014Learning for Caf\u00e9s: AI\u2019s  Impact"
+        expected = "machine learning for caf s ai s impact"
+        self.assertEqual(ai_analysis.normalize_text(text), expected)
+        self.assertEqual(ai_analysis_broad.normalize_text(text), expected)
+
+    def test_fuzzy_scores_round_half_to_even_and_break_ties_in_order(self) -> None:
+        from rapidfuzz import fuzz
+
+        import ai_analysis
+        import ai_analysis_broad
+
+        # Exactly 62.5 rounds half to even, to 62, so it misses a threshold of 63.
+        self.assertEqual(fuzz.partial_ratio("agent model", "model agent"), 62.5)
+        scores = ai_analysis.max_fuzzy_scores(
+            ["agent model", ""], ["model agent"], score_cutoff=63
+        )
+        self.assertEqual(scores.tolist(), [62, 0])
+        scores, best = ai_analysis_broad.best_fuzzy_matches(
+            ["agent model"], ["model agent"], score_cutoff=63
+        )
+        self.assertEqual(scores.tolist(), [62])
+
+        # 70.6 and 71.4 both round to 71; the earlier phrase wins the tie.
+        scores, best = ai_analysis_broad.best_fuzzy_matches(
+            ["neural data"], ["agent data", "deep data"]
+        )
+        self.assertEqual((scores.tolist(), best.tolist()), ([71], [0]))
+
+    def test_broad_match_pattern_matrix_keeps_overlapping_labels(self) -> None:
+        import ai_analysis_broad
+
+        labels = [label for label, _ in ai_analysis_broad.BROAD_LABEL_PATTERNS]
+        patterns = [pattern for _, pattern in ai_analysis_broad.BROAD_LABEL_PATTERNS]
+        texts = [
+            ai_analysis_broad.normalize_text("Generative AI for Robotics"),
+            ai_analysis_broad.normalize_text("Financial Accounting"),
+        ]
+
+        hits = ai_analysis_broad.match_pattern_matrix(texts, patterns)
+        self.assertEqual(hits.shape, (2, len(patterns)))
+        self.assertEqual(
+            {label for label, hit in zip(labels, hits[0]) if hit},
+            {"ai", "generative_ai", "robotics"},
+        )
+        self.assertFalse(hits[1].any())
+
+    def test_ethics_match_series_agrees_with_is_match(self) -> None:
+        import pandas as pd
+
+        from ethics_analysis import EthicsMatcher
+
+        matcher = EthicsMatcher.build()
+        titles = ["Bioethics", "Accounting", None, "Ethical Hacking"]
+        descriptions = [None, "Covers the code of ethics.", "Intro to biology.", ""]
+
+        flags = matcher.match_series(pd.Series(titles), pd.Series(descriptions))
+        expected = [
+            matcher.is_match(title, description)
+            for title, description in zip(titles, descriptions)
+        ]
+        self.assertEqual(list(flags), expected)
+        self.assertEqual(expected, [True, True, False, True])
+
+    def test_broad_and_ethics_scripts_handle_all_empty_description(self) -> None:
+        with TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            input_csv = tmp_path / "courses.csv"
+            broad_csv = tmp_path / "broad.csv"
+            ethics_csv = tmp_path / "ethics.csv"
+
+            # Every description is empty, so the column carries no type information.
+            _write_csv(
+                input_csv,
+                [
+                    {
+                        "term": "Fall 2025",
+                        "prefix": "CS",
+                        "number": "470",
+                        "title": "Ethics of AI",
+                        "description": "",
+                    },
+                    {
+                        "term": "Fall 2025",
+                        "prefix": "EE",
+                        "number": "100",
+                        "title": "Robotics",
+                        "description": "",
+                    },
+                ],
+            )
+
+            for script, output in (
+                ("ai_analysis_broad.py", broad_csv),
+                ("ethics_analysis.py", ethics_csv),
+            ):
+                subprocess.run(
+                    [
+                        sys.executable,
+                        script,
+                        "--input-courses",
+                        str(input_csv),
+                        "--output",
+                        str(output),
+                    ],
+                    check=True,
+                    cwd=REPO_ROOT,
+                )
+
+            with broad_csv.open(newline="", encoding="utf-8") as f:
+                broad_rows = list(csv.DictReader(f))
+            with ethics_csv.open(newline="", encoding="utf-8") as f:
+                ethics_rows = list(csv.DictReader(f))
+
+            self.assertEqual(
+                [(row["prefix"], row["ai_candidate_reason"]) for row in broad_rows],
+                [("CS", "ai"), ("EE", "robotics")],
+            )
+            self.assertEqual([row["prefix"] for row in ethics_rows], ["CS"])
+
     def test_context_gating_ethics_requires_ai_context(self) -> None:
         import ai_analysis
 
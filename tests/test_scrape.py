@@ -0,0 +1,381 @@
+import csv
+import io
+import json
+import sys
+import threading
+import time
+import unittest
+from contextlib import redirect_stdout
+from dataclasses import replace
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import mock
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+# When running this file directly (`python3 tests/test_scrape.py`), Python sets
+# `sys.path[0]` to the tests directory. Add the repo root so we can import scripts
+# like `scrape.py` as modules.
+sys.path.insert(0, str(REPO_ROOT))
+
+
+def _deps_available() -> bool:
+    try:
+        import httpx  # noqa: F401
+        import selectolax  # noqa: F401
+        import selenium  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+HAS_DEPS = _deps_available()
+
+RESULTS_HTML = """
+<html><body><div id="main">
+<h1>Course Search Results</h1>
+<dl id="results-list">
+  <dt class="result-item"><a href="course?courseId=000005&amp;term=1257">ACC 255</a></dt>
+  <dt class="result-item"><a href="course?courseId=000004&amp;term=1257">ACC 199</a></dt>
+  <dt class="result-item"><a href="course?courseId=000005&amp;term=1257">ACC 255</a></dt>
+</dl>
+</div></body></html>
+"""
+
+NO_RESULTS_HTML = """
+<html><body><div id="main"><h1>
+  No courses   found
+</h1></div></body></html>
+"""
+
+MAINTENANCE_HTML = "<html><body><p>Down for maintenance.</p></body></html>"
+
+COURSE_HTML = """
+<html><body>
+<h1 id="h1-first">Course Search<br>Catalog Year: 2025 - 2026</h1>
+<div id="courseResults">
+  <h2>ACC  255 -  Financial Accounting</h2>
+  <strong>Description:</strong> Introduces financial accounting.<br>
+  <strong>Units:</strong>
+  3<br>
+  <strong>Sections offered:</strong>
+  <a href="fall">Fall 2025</a>; <a href="spring">Spring 2026</a>
+</div>
+</body></html>
+"""
+
+
+def _results_html(course_ids: list[str], term_code: int) -> str:
+    """Return a results page listing the given course ids."""
+    items = "".join(
+        f'<dt class="result-item"><a href="course?courseId={course_id}'
+        f'&amp;term={term_code}">{course_id}</a></dt>'
+        for course_id in course_ids
+    )
+    return f'<div id="main"><dl id="results-list">{items}</dl></div>'
+
+
+def _mock_client(pages: dict[str, str], requested: list[str] | None = None):
+    """
+    Return an httpx client serving `pages` keyed by a substring of the URL.
+
+    Every requested URL is appended to `requested` when one is given.
+    """
+    import httpx
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if requested is not None:
+            requested.append(url)
+        for needle, html in pages.items():
+            if needle in url:
+                return httpx.Response(200, text=html)
+        return httpx.Response(404)
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+@unittest.skipUnless(
+    HAS_DEPS,
+    "Requires httpx + selectolax + selenium. "
+    "Install: pip install httpx selectolax selenium",
+)
+class TestScrape(unittest.TestCase):
+    def setUp(self) -> None:
+        import scrape
+
+        # No real waiting: tests never hit the network.
+        for name, value in (
+            ("SLEEP_TIME", 0),
+            ("RATE_LIMITER", scrape.RateLimiter(1_000_000)),
+        ):
+            patcher = mock.patch.object(scrape, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_parse_course_html_reads_fields(self) -> None:
+        import scrape
+
+        page = scrape.parse_course_html(COURSE_HTML)
+        self.assertEqual(page["header"], "ACC 255 - Financial Accounting")
+        self.assertEqual(page["description"], "Introduces financial accounting.")
+        self.assertEqual(page["units"], "3")
+        self.assertEqual(page["sections"], ["Fall 2025", "Spring 2026"])
+
+        url = "https://catalog.nau.edu/Courses/course?courseId=000005&term=1257"
+        course = scrape.build_course(page, url, "Fall 2025")
+        self.assertEqual(
+            (course.prefix, course.number, course.title, course.catalog_year),
+            ("ACC", "255", "Financial Accounting", "2025-2026"),
+        )
+        self.assertEqual(course.sections_offered, "Fall 2025; Spring 2026")
+
+        # Pages without the course header are left to the Selenium fallback.
+        self.assertIsNone(scrape.parse_course_html(MAINTENANCE_HTML))
+
+    def test_fetch_course_links_states(self) -> None:
+        import scrape
+
+        client = _mock_client(
+            {
+                "subject=ACC": RESULTS_HTML,
+                "subject=BIO": NO_RESULTS_HTML,
+                "subject=CS": MAINTENANCE_HTML,
+            }
+        )
+        with client:
+            links, status = scrape.fetch_course_links(client, "ACC", 1257)
+            self.assertEqual(status, "ok")
+            # Relative hrefs resolve against the results page; duplicates collapse.
+            self.assertEqual(
+                links,
+                [
+                    f"{scrape.BASE}/course?courseId=000004&term=1257",
+                    f"{scrape.BASE}/course?courseId=000005&term=1257",
+                ],
+            )
+            self.assertEqual(
+                scrape.fetch_course_links(client, "BIO", 1257), ([], "empty")
+            )
+            self.assertIsNone(scrape.fetch_course_links(client, "CS", 1257))
+            self.assertEqual(
+                scrape.fetch_course_links(client, "ENG", 1257), ([], "error")
+            )
+
+    def test_scrape_prefix_reports_error_when_fallback_driver_fails(self) -> None:
+        import scrape
+        from selenium.common.exceptions import WebDriverException
+
+        pool = mock.Mock()
+        pool.get.side_effect = WebDriverException("chrome not found")
+        with _mock_client({"subject=CS": MAINTENANCE_HTML}) as client:
+            result = scrape.scrape_prefix(
+                pool, client, "Fall 2025", 1257, "CS", {}, threading.Lock()
+            )
+        self.assertEqual((result.status, result.links_found), ("error", 0))
+
+    def test_scrape_prefix_keeps_courses_when_fallback_driver_fails(self) -> None:
+        import scrape
+
+        pool = mock.Mock()
+        pool.get.side_effect = OSError("chromedriver not found")
+        pages = {
+            "subject=ACC": _results_html(["000004", "000005", "000006"], 1257),
+            "courseId=000004": COURSE_HTML,
+            "courseId=": MAINTENANCE_HTML,
+        }
+        with _mock_client(pages) as client, redirect_stdout(io.StringIO()):
+            result = scrape.scrape_prefix(
+                pool, client, "Fall 2025", 1257, "ACC", {}, threading.Lock()
+            )
+        # The page fetched over HTTP is kept; Chrome is only tried once.
+        self.assertEqual(result.status, "ok")
+        self.assertEqual(
+            [course.url for course in result.courses],
+            [f"{scrape.BASE}/course?courseId=000004&term=1257"],
+        )
+        self.assertEqual(pool.get.call_count, 1)
+
+    def test_scrape_prefix_reuses_courses_across_terms(self) -> None:
+        import scrape
+
+        self.assertEqual(
+            scrape.course_key(f"{scrape.BASE}/course?courseId=000005&term=1257"),
+            f"{scrape.BASE}/course?courseId=000005",
+        )
+
+        def scrape_both_terms(course_cache):
+            requested: list[str] = []
+            pages = {
+                "subject=ACC&catNbr=&term=1257": RESULTS_HTML,
+                "subject=ACC&catNbr=&term=1261": RESULTS_HTML.replace(
+                    "term=1257", "term=1261"
+                ),
+                "courseId=": COURSE_HTML,
+            }
+            terms = (("Fall 2025", 1257), ("Spring 2026", 1261))
+            results = []
+            with _mock_client(pages, requested) as client:
+                for term_label, term_code in terms:
+                    results.append(
+                        scrape.scrape_prefix(
+                            None,
+                            client,
+                            term_label,
+                            term_code,
+                            "ACC",
+                            {},
+                            threading.Lock(),
+                            course_cache,
+                        )
+                    )
+            course_fetches = [url for url in requested if "courseId=" in url]
+            return results, course_fetches
+
+        # --reuse-terms: the second term copies the first term's courses.
+        (fall, spring), fetches = scrape_both_terms({})
+        self.assertEqual(
+            fetches,
+            [
+                f"{scrape.BASE}/course?courseId=000004&term=1257",
+                f"{scrape.BASE}/course?courseId=000005&term=1257",
+            ],
+        )
+        self.assertEqual((fall.reused, spring.reused), (0, 2))
+        self.assertEqual(
+            [(course.term, course.url) for course in spring.courses],
+            [
+                ("Spring 2026", f"{scrape.BASE}/course?courseId=000004&term=1261"),
+                ("Spring 2026", f"{scrape.BASE}/course?courseId=000005&term=1261"),
+            ],
+        )
+        self.assertEqual(spring.courses[0].title, fall.courses[0].title)
+
+        # Default: every term's course pages are fetched.
+        (_, spring), fetches = scrape_both_terms(None)
+        self.assertEqual(len(fetches), 4)
+        self.assertEqual(spring.reused, 0)
+
+    def test_main_records_results_in_submission_order(self) -> None:
+        import httpx
+        import scrape
+
+        prefixes = ["ACC", "BIO", "CS"]
+        # Earlier prefixes answer slowest, so workers finish in reverse order.
+        delays = {"ACC": 0.2, "BIO": 0.1, "CS": 0.0}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if "subject" not in request.url.params:
+                return httpx.Response(200, text=COURSE_HTML)
+            prefix = request.url.params["subject"]
+            time.sleep(delays[prefix])
+            if prefix == "BIO":
+                return httpx.Response(200, text=NO_RESULTS_HTML)
+            # CS lists a course of its own plus one cross-listed with ACC.
+            ids = ["000004", "000005"] if prefix == "ACC" else ["000005", "000009"]
+            return httpx.Response(
+                200, text=_results_html(ids, int(request.url.params["term"]))
+            )
+
+        with TemporaryDirectory() as tmp:
+            out = Path(tmp)
+            prefixes_path = out / "prefixes.json"
+            prefixes_path.write_text(json.dumps(prefixes), encoding="utf-8")
+            argv = ["scrape.py", "--prefixes", str(prefixes_path), "--workers", "4"]
+            with mock.patch.multiple(
+                scrape,
+                CSV_PATH=str(out / "nau_courses.csv"),
+                CSV_TMP_PATH=str(out / "nau_courses.csv.tmp"),
+                STATE_DB_PATH=str(out / "nau_courses.db"),
+                EMPTY_PREFIXES_CSV=str(out / "nau_empty_prefixes.csv"),
+                make_http_client=lambda workers: httpx.Client(
+                    transport=httpx.MockTransport(handler)
+                ),
+            ), mock.patch.object(sys, "argv", argv), redirect_stdout(io.StringIO()):
+                scrape.main()
+
+            with (out / "nau_courses.csv").open(newline="", encoding="utf-8") as f:
+                courses = [(row["term"], row["url"]) for row in csv.DictReader(f)]
+            empty_csv = out / "nau_empty_prefixes.csv"
+            with empty_csv.open(newline="", encoding="utf-8") as f:
+                empty = [(row["term"], row["prefix"]) for row in csv.DictReader(f)]
+
+        # Term order, then prefix order, then sorted links; the cross-listed
+        # course stays with ACC, the first prefix that lists it.
+        expected = [
+            (term_label, f"{scrape.BASE}/course?courseId={course_id}&term={term_code}")
+            for term_label, term_code in scrape.TERM_CODES.items()
+            for course_id in ("000004", "000005", "000009")
+        ]
+        self.assertEqual(courses, expected)
+        self.assertEqual(empty, [(term, "BIO") for term in scrape.TERM_CODES])
+
+    def test_state_db_round_trips_existing_csv(self) -> None:
+        import scrape
+
+        courses = [
+            scrape.Course(
+                term="Fall 2025",
+                catalog_year="2025-2026",
+                prefix="ACC",
+                number="255",
+                title="Financial Accounting",
+                description='Debits, credits, and "ledgers".',
+                units="3",
+                sections_offered="",
+                url=f"{scrape.BASE}/course?courseId=000005&term=1257",
+            ),
+            scrape.Course(
+                term="Fall 2025",
+                catalog_year="",
+                prefix="BIO",
+                number="100",
+                title="Biology",
+                description="",
+                units="4",
+                sections_offered="Fall 2025",
+                url=f"{scrape.BASE}/course?courseId=000100&term=1257",
+            ),
+        ]
+        with TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / "nau_courses.csv"
+            with csv_path.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(scrape.COURSE_FIELDS)
+                writer.writerows(scrape.course_row(course) for course in courses)
+            original = csv_path.read_bytes()
+
+            with mock.patch.multiple(
+                scrape,
+                CSV_PATH=str(csv_path),
+                CSV_TMP_PATH=f"{csv_path}.tmp",
+                EMPTY_PREFIXES_CSV=str(Path(tmp) / "nau_empty_prefixes.csv"),
+            ):
+                conn = scrape.open_state_db(str(Path(tmp) / "nau_courses.db"))
+                try:
+                    self.assertEqual(scrape.import_existing_csv(conn), 2)
+                    # A non-empty database is never re-seeded.
+                    self.assertEqual(scrape.import_existing_csv(conn), 0)
+                    self.assertEqual(
+                        scrape.load_seen_urls(conn), {course.url for course in courses}
+                    )
+
+                    self.assertEqual(scrape.export_csv(conn), 2)
+                    self.assertEqual(csv_path.read_bytes(), original)
+
+                    # Saving a course again updates its row by URL, in place.
+                    scrape.save_courses(conn, [replace(courses[0], units="4")])
+                    self.assertEqual(scrape.export_csv(conn), 2)
+                finally:
+                    conn.close()
+
+            with csv_path.open(newline="", encoding="utf-8") as f:
+                exported = list(csv.DictReader(f))
+            self.assertEqual(
+                [(row["prefix"], row["units"]) for row in exported],
+                [("ACC", "4"), ("BIO", "4")],
+            )
+            self.assertFalse(Path(f"{csv_path}.tmp").exists())
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)